@@ -1,18 +1,17 @@
 import os
 
+import numpy
+
 import efel
 
 
-meanfrequency1_url = 'file://%s/C14010092-MT-C1.V.50.1.txt' % os.path.abspath(
+meanfrequency1_filename = '%s/C14010092-MT-C1.V.50.1.txt' % os.path.abspath(
     os.path.dirname(__file__))
 
 
-time = efel.io.load_fragment(
-    '%s#col=1' %
-    meanfrequency1_url)
-voltage = efel.io.load_fragment(
-    '%s#col=2' %
-    meanfrequency1_url)
+# Parse the trace file once and slice out both columns
+time, voltage = numpy.loadtxt(
+    meanfrequency1_filename, usecols=(0, 1), unpack=True)
 
 import matplotlib.pyplot as plt
 plt.plot(time, voltage)
@@ -30,6 +29,6 @@ feature_names = ['mean_frequency', 'AP_amplitude', 'AP_width']
 
 
 print efel.getFeatureValues([trace], feature_names)
-meanfrequency1_url
+meanfrequency1_filename
 
 